@@ -7,10 +7,21 @@ Uses Wikimedia Commons API to find and download CC-licensed images.
 import re
 import os
 import json
+import string
+import shutil
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import time
+from io import BytesIO
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -20,6 +31,74 @@ except ImportError:
     print("Warning: Pillow not installed. Citation overlays will be skipped.")
     print("Install with: pip3 install --user Pillow")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Kept connections per host in SESSION; scripts reject --workers values above it, since
+# threads beyond the pool size would have their connections discarded after each request
+SESSION_POOL_SIZE = 32
+
+# One session for all Wikimedia requests so TCP/TLS connections are kept alive and reused
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'MedicalEducationImageDownloader/1.0 (https://example.com/contact)'
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=2,  # commons.wikimedia.org (API) and upload.wikimedia.org (images)
+    pool_maxsize=SESSION_POOL_SIZE,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Width of the server-side thumbnails requested from Commons; originals can be tens of MB
+THUMBNAIL_WIDTH = 1280
+
+
+class RateLimiter:
+    """Token bucket shared by all threads: `rate` calls per second on average,
+    with up to `burst` calls allowed back to back after an idle spell.
+    
+    Implemented as a virtual-schedule (GCRA) bucket, so waiting callers sleep
+    exactly until their token is due instead of polling.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self._lock = threading.Lock()
+        self._next_due = time.monotonic()
+        self.set_rate(rate, burst)
+    
+    def set_rate(self, rate: float, burst: Optional[int] = None):
+        """Change the rate (e.g. from a command-line flag); burst is kept unless given."""
+        with self._lock:
+            if burst is None:
+                burst = self.burst
+            self.rate = rate
+            self.burst = burst
+            self.interval = 1.0 / rate
+            self.burst_window = (burst - 1) * self.interval
+    
+    def wait(self):
+        """Block until the caller's token is available; each caller reserves the next one."""
+        with self._lock:
+            now = time.monotonic()
+            due = max(self._next_due, now)
+            self._next_due = due + self.interval
+            ready_at = due - self.burst_window
+        if ready_at > now:
+            time.sleep(ready_at - now)
+
+
+# One bucket per host, so the request rate stays polite however many questions run at once:
+# API queries to commons.wikimedia.org, and image fetches from upload.wikimedia.org
+API_RATE_LIMITER = RateLimiter(rate=5.0, burst=10)
+UPLOAD_RATE_LIMITER = RateLimiter(rate=10.0, burst=10)
+
 # Content text with all questions
 CONTENT = """IvyTutoring
 
@@ -809,129 +888,166 @@ Question 68: A 45-year-old woman presents with fatigue and pallor. Her laborator
 """
 
 
+# Splits the content into [preamble, number, block, number, block, ...]
+_QUESTION_SPLIT_RE = re.compile(r'Question (\d+):\s*')
+
+
 def extract_questions(content: str) -> List[Dict[str, str]]:
     """Extract questions and their main topics from the content."""
     questions = []
     
-    # Pattern to match questions
-    question_pattern = r'Question (\d+):\s*(.*?)(?=Answer:|$)'
-    answer_pattern = r'Answer:\s*(.*?)(?=Explanation:|$)'
-    
-    # Find all questions
-    question_matches = re.finditer(question_pattern, content, re.DOTALL)
-    
-    for match in question_matches:
-        q_num = int(match.group(1))
-        q_text = match.group(2).strip()
+    # One forward split on the question headings; each block is then sliced with str.find
+    parts = _QUESTION_SPLIT_RE.split(content)
+    for number, block in zip(parts[1::2], parts[2::2]):
+        answer_start = block.find('Answer:')
+        if answer_start == -1:
+            continue
+        explanation_start = block.find('Explanation:', answer_start)
+        if explanation_start == -1:
+            explanation_start = len(block)
         
-        # Find the corresponding answer
-        answer_match = re.search(
-            rf'Question {q_num}:.*?Answer:\s*(.*?)(?=Explanation:|$)',
-            content,
-            re.DOTALL
-        )
+        q_text = block[:answer_start].strip()
+        answer = block[answer_start + len('Answer:'):explanation_start].strip()
         
-        if answer_match:
-            answer = answer_match.group(1).strip()
+        questions.append({
+            'number': int(number),
+            'question': q_text,
+            'answer': answer,
             # Extract main topic from answer (usually the condition/disease name)
-            topic = extract_topic(answer, q_text)
-            
-            questions.append({
-                'number': q_num,
-                'question': q_text,
-                'answer': answer,
-                'topic': topic
-            })
+            'topic': extract_topic(answer, q_text)
+        })
     
     return questions
 
 
+def load_questions(questions_file: Path) -> List[Dict[str, str]]:
+    """Load pre-extracted questions (number, question, answer) from a JSON file
+    and derive each one's search topic."""
+    with open(questions_file, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+    
+    for q in questions:
+        # Extract main topic from answer (usually the condition/disease name)
+        q['topic'] = extract_topic(q['answer'], q['question'])
+    
+    return questions
+
+
+# Mapping of answers to search terms (more specific), checked in this order
+ANSWER_TO_TOPIC = {
+    'paroxysmal nocturnal hemoglobinuria': 'paroxysmal nocturnal hemoglobinuria',
+    'pnh': 'paroxysmal nocturnal hemoglobinuria',
+    'hemoglobin electrophoresis': 'hemoglobin electrophoresis thalassemia',
+    'vitamin b12 deficiency': 'vitamin b12 deficiency anemia',
+    'vitamin b6': 'vitamin b6 pyridoxine sideroblastic anemia',
+    'pyridoxine': 'vitamin b6 pyridoxine sideroblastic anemia',
+    'iron deficiency anemia': 'iron deficiency anemia',
+    'beta-thalassemia major': 'beta thalassemia major',
+    'warm autoimmune hemolytic anemia': 'autoimmune hemolytic anemia',
+    'treat the underlying disease': 'anemia of chronic disease',
+    'glucose-6-phosphate dehydrogenase': 'g6pd deficiency hemolytic anemia',
+    'g6pd deficiency': 'g6pd deficiency hemolytic anemia',
+    'autoimmune destruction': 'pernicious anemia vitamin b12',
+    'folate deficiency': 'folate deficiency megaloblastic anemia',
+    'stem cell transplant': 'fanconi anemia',
+    'pigmented gallstones': 'hereditary spherocytosis',
+    'splenic sequestration crisis': 'sickle cell disease',
+    'pyruvate kinase deficiency': 'pyruvate kinase deficiency hemolytic anemia',
+    'basophilic stippling': 'lead poisoning anemia',
+    'vaccination and prophylactic antibiotics': 'sickle cell disease asplenia',
+    'acute chest syndrome': 'sickle cell disease acute chest syndrome',
+    'renal papillary necrosis': 'sickle cell trait',
+    'hydroxyurea': 'sickle cell disease hydroxyurea',
+    'abo incompatibility': 'abo incompatibility hemolytic disease newborn',
+    'rh incompatibility': 'rh incompatibility hemolytic disease newborn',
+    'porphyria cutanea tarda': 'porphyria cutanea tarda',
+    'pct': 'porphyria cutanea tarda',
+    'immune thrombocytopenic purpura': 'immune thrombocytopenic purpura itp',
+    'itp': 'immune thrombocytopenic purpura',
+    'acute intermittent porphyria': 'acute intermittent porphyria',
+    'bernard-soulier syndrome': 'bernard-soulier syndrome',
+    'vitamin k': 'vitamin k deficiency bleeding',
+    'desmopressin': 'von willebrand disease',
+    'uremic platelet dysfunction': 'uremic platelet dysfunction',
+    'hemophilia': 'hemophilia bleeding disorder',
+    'increased pt/ptt/bt/d-dimer': 'disseminated intravascular coagulation dic',
+    'disseminated intravascular coagulation': 'disseminated intravascular coagulation',
+    'dic': 'disseminated intravascular coagulation',
+    'factor v leiden': 'factor v leiden thrombophilia',
+    'antithrombin iii deficiency': 'antithrombin deficiency',
+    'antiphospholipid syndrome': 'antiphospholipid syndrome',
+    'heparin-induced thrombocytopenia': 'heparin induced thrombocytopenia',
+    'hit': 'heparin induced thrombocytopenia',
+    'factor xa inhibitor': 'rivaroxaban anticoagulant',
+    'bridging with heparin': 'warfarin skin necrosis',
+    'monitor with ptt': 'heparin anticoagulation',
+    'inhibits vitamin k': 'warfarin anticoagulation',
+    'irreversibly inhibits cox': 'aspirin antiplatelet',
+    'bcr-abl fusion': 'chronic myeloid leukemia cml',
+    't-cell acute lymphoblastic leukemia': 't-all acute lymphoblastic leukemia',
+    't-all': 't-cell acute lymphoblastic leukemia',
+    'reed-sternberg cells': 'hodgkin lymphoma',
+    'cladribine': 'hairy cell leukemia',
+    'all-trans retinoic acid': 'acute promyelocytic leukemia apl',
+    'atra': 'acute promyelocytic leukemia',
+    'thrombolytics': 'thrombolytic therapy tpa',
+    'chronic lymphocytic leukemia': 'chronic lymphocytic leukemia cll',
+    'cll': 'chronic lymphocytic leukemia',
+    'burkitt lymphoma': 'burkitt lymphoma',
+    'dilated cardiomyopathy': 'doxorubicin cardiomyopathy',
+    'marginal zone lymphoma': 'malt lymphoma',
+    'neutropenic fever': 'neutropenic fever chemotherapy',
+    'busulfan, bleomycin': 'pulmonary fibrosis chemotherapy',
+    'mycosis fungoides': 'mycosis fungoides cutaneous lymphoma',
+    '6-mp is degraded': 'mercaptopurine allopurinol',
+    'elevated uric acid': 'tumor lysis syndrome',
+    'inhibits microtubule': 'vincristine chemotherapy',
+    'primary cns lymphoma': 'primary cns lymphoma',
+    'waldenström macroglobulinemia': 'waldenstrom macroglobulinemia',
+    'hemorrhagic cystitis': 'cyclophosphamide chemotherapy',
+    'proteasome inhibitor': 'bortezomib multiple myeloma',
+    'leucovorin': 'methotrexate leucovorin rescue',
+    'multiple myeloma': 'multiple myeloma',
+}
+
+# All answer keys as one alternation inside a lookahead, so a single scan finds every key
+# occurrence (including overlapping ones); at each position the earliest-listed key wins
+_ANSWER_KEY_RE = re.compile('(?=(' + '|'.join(re.escape(key) for key in ANSWER_TO_TOPIC) + '))')
+_ANSWER_KEY_PRIORITY = {key: i for i, key in enumerate(ANSWER_TO_TOPIC)}
+
+# With pyahocorasick, all keys are matched in one linear scan by a prebuilt automaton
+if AHOCORASICK_AVAILABLE:
+    _ANSWER_KEY_AUTOMATON = ahocorasick.Automaton()
+    for _priority, _key in enumerate(ANSWER_TO_TOPIC):
+        _ANSWER_KEY_AUTOMATON.add_word(_key, (_priority, _key))
+    _ANSWER_KEY_AUTOMATON.make_automaton()
+
+
+def _find_answer_key(text: str) -> Optional[str]:
+    """Return the earliest-listed ANSWER_TO_TOPIC key found anywhere in text, if any."""
+    if AHOCORASICK_AVAILABLE:
+        found = [value for _, value in _ANSWER_KEY_AUTOMATON.iter(text)]
+        return min(found)[1] if found else None
+    
+    keys_found = [match.group(1) for match in _ANSWER_KEY_RE.finditer(text)]
+    if keys_found:
+        return min(keys_found, key=_ANSWER_KEY_PRIORITY.__getitem__)
+    return None
+
+
+@lru_cache(maxsize=None)
 def extract_topic(answer: str, question: str) -> str:
-    """Extract the main medical topic/condition from the answer or question."""
+    """Extract the main medical topic/condition from the answer or question.
+    
+    Memoized, since the same answers recur across question banks and reloads.
+    """
     answer_lower = answer.lower()
     question_lower = question.lower()
     
-    # Mapping of answers to search terms (more specific)
-    answer_to_topic = {
-        'paroxysmal nocturnal hemoglobinuria': 'paroxysmal nocturnal hemoglobinuria',
-        'pnh': 'paroxysmal nocturnal hemoglobinuria',
-        'hemoglobin electrophoresis': 'hemoglobin electrophoresis thalassemia',
-        'vitamin b12 deficiency': 'vitamin b12 deficiency anemia',
-        'vitamin b6': 'vitamin b6 pyridoxine sideroblastic anemia',
-        'pyridoxine': 'vitamin b6 pyridoxine sideroblastic anemia',
-        'iron deficiency anemia': 'iron deficiency anemia',
-        'beta-thalassemia major': 'beta thalassemia major',
-        'warm autoimmune hemolytic anemia': 'autoimmune hemolytic anemia',
-        'treat the underlying disease': 'anemia of chronic disease',
-        'glucose-6-phosphate dehydrogenase': 'g6pd deficiency hemolytic anemia',
-        'g6pd deficiency': 'g6pd deficiency hemolytic anemia',
-        'autoimmune destruction': 'pernicious anemia vitamin b12',
-        'folate deficiency': 'folate deficiency megaloblastic anemia',
-        'stem cell transplant': 'fanconi anemia',
-        'pigmented gallstones': 'hereditary spherocytosis',
-        'splenic sequestration crisis': 'sickle cell disease',
-        'pyruvate kinase deficiency': 'pyruvate kinase deficiency hemolytic anemia',
-        'basophilic stippling': 'lead poisoning anemia',
-        'vaccination and prophylactic antibiotics': 'sickle cell disease asplenia',
-        'acute chest syndrome': 'sickle cell disease acute chest syndrome',
-        'renal papillary necrosis': 'sickle cell trait',
-        'hydroxyurea': 'sickle cell disease hydroxyurea',
-        'abo incompatibility': 'abo incompatibility hemolytic disease newborn',
-        'rh incompatibility': 'rh incompatibility hemolytic disease newborn',
-        'porphyria cutanea tarda': 'porphyria cutanea tarda',
-        'pct': 'porphyria cutanea tarda',
-        'immune thrombocytopenic purpura': 'immune thrombocytopenic purpura itp',
-        'itp': 'immune thrombocytopenic purpura',
-        'acute intermittent porphyria': 'acute intermittent porphyria',
-        'bernard-soulier syndrome': 'bernard-soulier syndrome',
-        'vitamin k': 'vitamin k deficiency bleeding',
-        'desmopressin': 'von willebrand disease',
-        'uremic platelet dysfunction': 'uremic platelet dysfunction',
-        'hemophilia': 'hemophilia bleeding disorder',
-        'increased pt/ptt/bt/d-dimer': 'disseminated intravascular coagulation dic',
-        'disseminated intravascular coagulation': 'disseminated intravascular coagulation',
-        'dic': 'disseminated intravascular coagulation',
-        'factor v leiden': 'factor v leiden thrombophilia',
-        'antithrombin iii deficiency': 'antithrombin deficiency',
-        'antiphospholipid syndrome': 'antiphospholipid syndrome',
-        'heparin-induced thrombocytopenia': 'heparin induced thrombocytopenia',
-        'hit': 'heparin induced thrombocytopenia',
-        'factor xa inhibitor': 'rivaroxaban anticoagulant',
-        'bridging with heparin': 'warfarin skin necrosis',
-        'monitor with ptt': 'heparin anticoagulation',
-        'inhibits vitamin k': 'warfarin anticoagulation',
-        'irreversibly inhibits cox': 'aspirin antiplatelet',
-        'bcr-abl fusion': 'chronic myeloid leukemia cml',
-        't-cell acute lymphoblastic leukemia': 't-all acute lymphoblastic leukemia',
-        't-all': 't-cell acute lymphoblastic leukemia',
-        'reed-sternberg cells': 'hodgkin lymphoma',
-        'cladribine': 'hairy cell leukemia',
-        'all-trans retinoic acid': 'acute promyelocytic leukemia apl',
-        'atra': 'acute promyelocytic leukemia',
-        'thrombolytics': 'thrombolytic therapy tpa',
-        'chronic lymphocytic leukemia': 'chronic lymphocytic leukemia cll',
-        'cll': 'chronic lymphocytic leukemia',
-        'burkitt lymphoma': 'burkitt lymphoma',
-        'dilated cardiomyopathy': 'doxorubicin cardiomyopathy',
-        'marginal zone lymphoma': 'malt lymphoma',
-        'neutropenic fever': 'neutropenic fever chemotherapy',
-        'busulfan, bleomycin': 'pulmonary fibrosis chemotherapy',
-        'mycosis fungoides': 'mycosis fungoides cutaneous lymphoma',
-        '6-mp is degraded': 'mercaptopurine allopurinol',
-        'elevated uric acid': 'tumor lysis syndrome',
-        'inhibits microtubule': 'vincristine chemotherapy',
-        'primary cns lymphoma': 'primary cns lymphoma',
-        'waldenström macroglobulinemia': 'waldenstrom macroglobulinemia',
-        'hemorrhagic cystitis': 'cyclophosphamide chemotherapy',
-        'proteasome inhibitor': 'bortezomib multiple myeloma',
-        'leucovorin': 'methotrexate leucovorin rescue',
-        'multiple myeloma': 'multiple myeloma',
-    }
-    
-    # Check answer first
-    for key, topic in answer_to_topic.items():
-        if key in answer_lower:
-            return topic  # Return full topic for search
+    # Check answer first; the earliest-listed key found anywhere in the answer wins
+    key = _find_answer_key(answer_lower)
+    if key is not None:
+        return ANSWER_TO_TOPIC[key]  # Return full topic for search
     
     # Fallback: extract from answer text
     # Remove common prefixes
@@ -953,82 +1069,338 @@ def extract_topic(answer: str, question: str) -> str:
     return ' '.join(q_words)
 
 
-def search_wikimedia_commons(query: str, limit: int = 5) -> List[Dict]:
-    """Search Wikimedia Commons for Creative Commons licensed images."""
-    base_url = "https://commons.wikimedia.org/w/api.php"
+def _parse_json(response: requests.Response):
+    """Decode a JSON API response, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _read_json_file(path: Path):
+    """Load a JSON cache file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_file(data, path: Path):
+    """Write a JSON cache file atomically, using orjson when it is installed."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def json_line(record: Dict) -> str:
+    """Serialize one record as a line of a .jsonl file (orjson when it is installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE).decode('utf-8')
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+class SearchCache:
+    """Commons search results persisted between runs, keyed by normalized query.
     
-    headers = {
-        'User-Agent': 'MedicalEducationImageDownloader/1.0 (https://example.com/contact)'
-    }
+    Search results barely change from run to run, so reruns can skip the API
+    entirely for queries seen before. Delete the JSON file to refresh them.
+    """
+    
+    def __init__(self, index_path: Path):
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = {}
+        if index_path.exists():
+            try:
+                self._entries = _read_json_file(index_path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable search cache {index_path}: {e}")
+    
+    @staticmethod
+    def _key(query: str, limit: int) -> str:
+        return f"{limit}:{query}"
+    
+    def get(self, query: str, limit: int) -> Optional[List[Dict]]:
+        """Return the saved results for query, or None if it has not been searched."""
+        with self._lock:
+            results = self._entries.get(self._key(query, limit))
+        return list(results) if results is not None else None
+    
+    def put(self, query: str, limit: int, results: List[Dict]):
+        """Remember the results of a successful search."""
+        with self._lock:
+            self._entries[self._key(query, limit)] = results
+            self._dirty = True
+    
+    def flush(self):
+        """Write the cache atomically if anything was added."""
+        with self._lock:
+            if not self._dirty:
+                return
+            _write_json_file(self._entries, self.index_path)
+            self._dirty = False
+
+
+# Commons files with no still image to download (audio, video, paged documents).
+# SVG, TIFF and WebP stay: their THUMBNAIL_WIDTH thumbnails are PNG/JPEG renders.
+_NON_IMAGE_EXTENSIONS = ('.ogv', '.webm', '.ogg', '.oga', '.opus', '.mp3', '.wav', '.flac', '.mid',
+                         '.pdf', '.djvu')
+
+
+def _file_results(results: List[Dict]) -> List[Dict]:
+    """Keep only results whose title is a File: page holding a still image."""
+    return [
+        result for result in results
+        if result.get('title', '').startswith('File:')
+        and not result['title'].lower().endswith(_NON_IMAGE_EXTENSIONS)
+    ]
+
+
+def _alternative_terms(topic: str, answer: str) -> List[str]:
+    """Fallback search terms for a topic with no results, minus any that repeat the topic search."""
+    alt_terms = [
+        topic.replace(' ', '_'),
+        topic.lower(),
+        answer.split()[0] if answer else topic
+    ]
+    # Commons search ignores case and treats '_' as a space, so e.g. topic.lower() is the same search
+    seen = {topic.strip().lower().replace('_', ' ')}
+    terms = []
+    for term in alt_terms:
+        key = term.strip().lower().replace('_', ' ')
+        if key not in seen:
+            seen.add(key)
+            terms.append(term.strip())
+    return terms
+
+
+def _union_query(terms: List[str]) -> str:
+    """Join search terms into one Commons query matching any of them, quoting multi-word terms."""
+    return ' OR '.join(f'"{term}"' if ' ' in term else term for term in terms)
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase a search query for caching (Commons search ignores case), keeping OR operators."""
+    return ' OR '.join(part.strip().lower() for part in query.split(' OR '))
+
+
+@lru_cache(maxsize=256)
+def _candidates_cached(query: str, limit: int) -> Tuple[Dict, ...]:
+    """Search Commons and fetch each hit's image info in one generator query.
+    
+    Failures raise so they are never cached.
+    """
+    base_url = "https://commons.wikimedia.org/w/api.php"
     
     params = {
         'action': 'query',
         'format': 'json',
-        'list': 'search',
-        'srsearch': query,
-        'srnamespace': 6,  # File namespace
-        'srlimit': limit,
-        'srprop': 'size|wordcount|timestamp|snippet'
+        'generator': 'search',
+        'gsrsearch': query,
+        'gsrnamespace': 6,  # File namespace
+        'gsrlimit': limit,
+        'prop': 'imageinfo|revisions',
+        'iiprop': 'url|extmetadata',
+        'iiurlwidth': THUMBNAIL_WIDTH,
+        'rvprop': 'user'  # Latest revision of each page; rvlimit is single-page only
     }
     
+    API_RATE_LIMITER.wait()
+    response = SESSION.get(base_url, params=params, timeout=10)
+    response.raise_for_status()
+    data = _parse_json(response)
+    
+    # Generator pages come back keyed by page ID; 'index' restores the search ranking
+    pages = sorted(data.get('query', {}).get('pages', {}).values(), key=lambda page: page.get('index', 0))
+    
+    candidates = []
+    for page_data in _file_results(pages):
+        imageinfo = page_data.get('imageinfo', [])
+        if not imageinfo:
+            continue
+        info = imageinfo[0]
+        title = page_data['title']
+        candidates.append({
+            'title': title,
+            'url': info.get('thumburl') or info.get('url', ''),
+            'license': info.get('extmetadata', {}).get('License', {}).get('value', ''),
+            'metadata': _parse_image_metadata(title.replace('File:', '').strip(), info,
+                                              page_data.get('revisions', []))
+        })
+    return tuple(candidates)
+
+
+# One lock per (query, limit) searched this run, so identical searches are never in flight twice
+_QUERY_LOCKS: Dict[Tuple[str, int], threading.Lock] = {}
+_QUERY_LOCKS_GUARD = threading.Lock()
+
+
+def _query_lock(query: str, limit: int) -> threading.Lock:
+    """Return the lock serializing searches for one normalized query."""
+    with _QUERY_LOCKS_GUARD:
+        return _QUERY_LOCKS.setdefault((query, limit), threading.Lock())
+
+
+def _license_rank(license_info: str) -> int:
+    """Preference for a Commons License value: 0 public domain/CC0, 1 CC BY, 2 CC BY-SA, 3 other CC.
+    
+    Licenses that are not CC or public domain (e.g. GFDL only) rank 4.
+    """
+    license_code = license_info.strip().lower().replace(' ', '-')
+    if license_code.startswith(('cc0', 'pd')) or 'public-domain' in license_code:
+        return 0
+    if license_code.startswith('cc-by-sa'):
+        return 2
+    if license_code.startswith('cc-by'):
+        return 1
+    if license_code.startswith('cc'):
+        return 3
+    return 4
+
+
+def rank_by_license(candidates: List[Dict]) -> List[Dict]:
+    """Order candidates by license, least restrictive first.
+    
+    Candidates that are not CC or public domain are kept, as before ranking
+    was added, but come after all the others. The sort is stable, so
+    candidates with the same kind of license keep their search ranking.
+    Candidates cached before the raw license code was recorded are ranked by
+    their citation label instead.
+    """
+    return sorted(candidates, key=lambda candidate: _license_rank(
+        candidate.get('license') or candidate['metadata']['license']))
+
+
+def search_image_candidates(query: str, limit: int = 10, cache: Optional[SearchCache] = None) -> List[Dict]:
+    """Search Commons for still images, returning each hit's URL and citation metadata.
+    
+    Each candidate is a dict with 'title', 'url' (a THUMBNAIL_WIDTH thumbnail
+    when available), 'license' (the Commons license code) and 'metadata'.
+    CC and public domain images come first, least restrictive license first
+    and otherwise in search ranking order, so callers can download from the
+    top without checking licenses afterwards. Each search is a single API
+    call that also returns the image info. Memoized per run, and kept across
+    runs when a cache is given.
+    """
+    query = _normalize_query(query)
+    
+    if cache is not None:
+        candidates = cache.get(query, limit)
+        if candidates is not None:
+            return rank_by_license(candidates)
+    
     try:
-        response = requests.get(base_url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if 'query' in data and 'search' in data['query']:
-            return data['query']['search']
-        return []
+        # Threads asking for the same query wait for the first one's request and then
+        # hit the lru_cache, instead of all missing it at once
+        with _query_lock(query, limit):
+            candidates = list(_candidates_cached(query, limit))
     except Exception as e:
         print(f"Error searching Wikimedia Commons for '{query}': {e}")
         return []
+    
+    if cache is not None:
+        cache.put(query, limit, candidates)
+    return rank_by_license(candidates)
 
 
-def get_image_url(filename: str) -> str:
-    """Get the direct image URL from Wikimedia Commons filename."""
-    base_url = "https://commons.wikimedia.org/w/api.php"
+def candidates_with_fallback(topic: str, answer: str, limit: int = 10,
+                             cache: Optional[SearchCache] = None) -> List[Dict]:
+    """search_image_candidates() for a topic, falling back to alternative terms if it finds nothing.
     
-    headers = {
-        'User-Agent': 'MedicalEducationImageDownloader/1.0 (https://example.com/contact)'
-    }
+    The alternative terms are OR'd into a single query, so a topic with no
+    results costs one more API call rather than one per term.
+    """
+    candidates = search_image_candidates(topic, limit=limit, cache=cache)
     
-    # Remove "File:" prefix if present
-    filename = filename.replace('File:', '').strip()
+    alt_terms = _alternative_terms(topic, answer)
+    if not candidates and alt_terms:
+        candidates = search_image_candidates(_union_query(alt_terms), limit=limit, cache=cache)
     
-    params = {
-        'action': 'query',
-        'format': 'json',
-        'titles': f'File:{filename}',
-        'prop': 'imageinfo',
-        'iiprop': 'url',
-        'iiurlwidth': '800'  # Get a reasonable size
-    }
+    return candidates
+
+
+# HTML markup in Commons extmetadata values (e.g. the Artist field's user-page links)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+@lru_cache(maxsize=None)
+def _short_license(license_info: str) -> str:
+    """Map a Commons License value (e.g. 'cc-by-sa-4.0') to the label used in citations.
     
-    try:
-        response = requests.get(base_url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        pages = data.get('query', {}).get('pages', {})
-        for page_id, page_data in pages.items():
-            imageinfo = page_data.get('imageinfo', [])
-            if imageinfo:
-                return imageinfo[0].get('url', '')
-        
-        return ''
-    except Exception as e:
-        print(f"Error getting image URL for '{filename}': {e}")
-        return ''
+    Only a handful of distinct license codes occur, so each is classified once per run.
+    """
+    license_lower = license_info.lower()
+    license_short = 'CC'
+    if 'cc-by' in license_lower or 'cc by' in license_lower:
+        license_short = 'CC BY'
+        if '2.0' in license_info:
+            license_short = 'CC BY 2.0'
+        elif '3.0' in license_info:
+            license_short = 'CC BY 3.0'
+        elif '4.0' in license_info:
+            license_short = 'CC BY 4.0'
+    elif 'cc-by-sa' in license_lower:
+        license_short = 'CC BY-SA'
+        if '2.0' in license_info:
+            license_short = 'CC BY-SA 2.0'
+        elif '3.0' in license_info:
+            license_short = 'CC BY-SA 3.0'
+        elif '4.0' in license_info:
+            license_short = 'CC BY-SA 4.0'
+    elif 'cc0' in license_lower or 'public domain' in license_lower:
+        license_short = 'CC0'
+    return license_short
+
+
+def _parse_image_metadata(filename_clean: str, info: Dict, revisions: List[Dict]) -> Dict:
+    """Build the citation metadata dict from an imageinfo entry and its latest revision."""
+    extmetadata = info.get('extmetadata', {})
+    
+    # Extract metadata
+    title = extmetadata.get('ObjectName', {}).get('value', '') or filename_clean
+    author = extmetadata.get('Artist', {}).get('value', '')
+    if not author and revisions:
+        author = revisions[0].get('user', 'Unknown')
+    if not author:
+        author = 'Unknown'
+    
+    # Clean HTML tags from author name
+    author = _HTML_TAG_RE.sub('', author)
+    author = author.strip()
+    if not author:
+        author = 'Unknown'
+    
+    # Get license
+    license_short = _short_license(extmetadata.get('License', {}).get('value', ''))
+    
+    # Source URL
+    source_url = info.get('descriptionurl', '') or f"https://commons.wikimedia.org/wiki/File:{filename_clean.replace(' ', '_')}"
+    
+    # Author URL (if available)
+    author_url = ''
+    if author and author != 'Unknown':
+        author_url = f"https://commons.wikimedia.org/wiki/User:{author.replace(' ', '_')}"
+    
+    return {
+        'title': title,
+        'author': author,
+        'author_url': author_url,
+        'license': license_short,
+        'source_url': source_url,
+        'filename': filename_clean
+    }
 
 
 def get_image_metadata(filename: str) -> Optional[Dict]:
     """Get image metadata including author, title, license, and source URL."""
     base_url = "https://commons.wikimedia.org/w/api.php"
     
-    headers = {
-        'User-Agent': 'MedicalEducationImageDownloader/1.0 (https://example.com/contact)'
-    }
-    
     filename_clean = filename.replace('File:', '').strip()
     
     params = {
@@ -1042,9 +1414,10 @@ def get_image_metadata(filename: str) -> Optional[Dict]:
     }
     
     try:
-        response = requests.get(base_url, params=params, headers=headers, timeout=10)
+        API_RATE_LIMITER.wait()
+        response = SESSION.get(base_url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = _parse_json(response)
         
         pages = data.get('query', {}).get('pages', {})
         for page_id, page_data in pages.items():
@@ -1055,62 +1428,7 @@ def get_image_metadata(filename: str) -> Optional[Dict]:
             revisions = page_data.get('revisions', [])
             
             if imageinfo:
-                info = imageinfo[0]
-                extmetadata = info.get('extmetadata', {})
-                
-                # Extract metadata
-                title = extmetadata.get('ObjectName', {}).get('value', '') or filename_clean
-                author = extmetadata.get('Artist', {}).get('value', '')
-                if not author and revisions:
-                    author = revisions[0].get('user', 'Unknown')
-                if not author:
-                    author = 'Unknown'
-                
-                # Clean HTML tags from author name
-                import re as re_module
-                author = re_module.sub(r'<[^>]+>', '', author)
-                author = author.strip()
-                if not author:
-                    author = 'Unknown'
-                
-                # Get license
-                license_info = extmetadata.get('License', {}).get('value', '')
-                license_short = 'CC'
-                if 'cc-by' in license_info.lower() or 'cc by' in license_info.lower():
-                    license_short = 'CC BY'
-                    if '2.0' in license_info:
-                        license_short = 'CC BY 2.0'
-                    elif '3.0' in license_info:
-                        license_short = 'CC BY 3.0'
-                    elif '4.0' in license_info:
-                        license_short = 'CC BY 4.0'
-                elif 'cc-by-sa' in license_info.lower():
-                    license_short = 'CC BY-SA'
-                    if '2.0' in license_info:
-                        license_short = 'CC BY-SA 2.0'
-                    elif '3.0' in license_info:
-                        license_short = 'CC BY-SA 3.0'
-                    elif '4.0' in license_info:
-                        license_short = 'CC BY-SA 4.0'
-                elif 'cc0' in license_info.lower() or 'public domain' in license_info.lower():
-                    license_short = 'CC0'
-                
-                # Source URL
-                source_url = info.get('descriptionurl', '') or f"https://commons.wikimedia.org/wiki/File:{filename_clean.replace(' ', '_')}"
-                
-                # Author URL (if available)
-                author_url = ''
-                if author and author != 'Unknown':
-                    author_url = f"https://commons.wikimedia.org/wiki/User:{author.replace(' ', '_')}"
-                
-                return {
-                    'title': title,
-                    'author': author,
-                    'author_url': author_url,
-                    'license': license_short,
-                    'source_url': source_url,
-                    'filename': filename_clean
-                }
+                return _parse_image_metadata(filename_clean, imageinfo[0], revisions)
         
         return None
     except Exception as e:
@@ -1118,14 +1436,6 @@ def get_image_metadata(filename: str) -> Optional[Dict]:
         return None
 
 
-def check_cc_license(filename: str) -> bool:
-    """Check if the image has a Creative Commons license."""
-    metadata = get_image_metadata(filename)
-    if metadata:
-        return metadata['license'].startswith('CC')
-    return False
-
-
 def search_unsplash(query: str, limit: int = 5) -> List[Dict]:
     """Search Unsplash for free images (fallback when Wikimedia Commons fails)."""
     # Unsplash Source API - free, no authentication required
@@ -1147,19 +1457,175 @@ def search_unsplash(query: str, limit: int = 5) -> List[Dict]:
     return results
 
 
-def download_image(url: str, filepath: Path) -> bool:
-    """Download an image from a URL."""
-    headers = {
-        'User-Agent': 'MedicalEducationImageDownloader/1.0 (https://example.com/contact)'
-    }
+class DownloadCache:
+    """Index of images saved by earlier runs, keyed by a hash of the source URL.
+    
+    Lets reruns skip images whose file is still on disk and whose ETag has not
+    changed. The index is a JSON file next to the images; it is rewritten at most
+    every flush_interval seconds, plus once more when flush(force=True) is called.
+    """
+    
+    def __init__(self, index_path: Path, flush_interval: float = 5.0):
+        self.index_path = index_path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._dirty = False
+        self._entries = {}
+        if index_path.exists():
+            try:
+                self._entries = _read_json_file(index_path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable download cache {index_path}: {e}")
+    
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def is_current(self, url: str, filepath: Path) -> bool:
+        """Check whether filepath already holds the unchanged image from url."""
+        with self._lock:
+            entry = self._entries.get(self._key(url))
+        if not entry or filepath.name not in entry['files'] or not filepath.exists():
+            return False
+        if not entry['etag']:
+            return True
+        
+        # Cheap on a keep-alive connection; a changed ETag means the file was re-uploaded
+        try:
+            UPLOAD_RATE_LIMITER.wait()
+            response = SESSION.head(url, timeout=10, allow_redirects=True)
+            return response.ok and response.headers.get('ETag', '') == entry['etag']
+        except Exception:
+            return False
+    
+    def record(self, url: str, filepath: Path, etag: str):
+        """Remember that url was saved as filepath."""
+        with self._lock:
+            entry = self._entries.setdefault(self._key(url), {'etag': etag, 'files': []})
+            if entry['etag'] != etag:
+                entry['etag'] = etag
+                entry['files'] = []
+            if filepath.name not in entry['files']:
+                entry['files'].append(filepath.name)
+            self._dirty = True
+        self.flush()
+    
+    def flush(self, force: bool = False):
+        """Write the index atomically if it changed and the flush interval has passed."""
+        with self._lock:
+            if not self._dirty or (not force and time.monotonic() - self._last_flush < self.flush_interval):
+                return
+            _write_json_file(self._entries, self.index_path)
+            self._dirty = False
+            self._last_flush = time.monotonic()
+
+
+# File extensions images are saved under; anything else (JPEG, TIFF thumbnails, ...) is saved as .jpg
+_SAVED_EXTENSIONS = {'.png': '.png', '.gif': '.gif', '.svg': '.svg'}
+
+
+def image_extension(image_url: str) -> str:
+    """Pick the extension to save an image under from its URL's path.
+    
+    Commons thumbnail URLs end in the rendered format (e.g. '...Foo.svg.png'),
+    so the path's own suffix is what the downloaded bytes actually are.
+    """
+    return _SAVED_EXTENSIONS.get(os.path.splitext(urlparse(image_url).path)[1].lower(), '.jpg')
+
+
+# Images larger than this (by Content-Length) are skipped rather than downloaded
+MAX_IMAGE_BYTES = 25 * 1024 * 1024
+
+
+def _skip_reason(response: requests.Response) -> str:
+    """Check the response headers before reading the body; returns why to skip it, or ''.
     
+    Oversized files (by Content-Length) and non-image responses, such as an
+    HTML error page served with a 200, are rejected without downloading them.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    if content_type and not content_type.startswith('image/'):
+        return f"not an image ({content_type})"
     try:
-        response = requests.get(url, headers=headers, timeout=30, stream=True)
-        response.raise_for_status()
+        if int(response.headers.get('Content-Length', '0')) > MAX_IMAGE_BYTES:
+            return f"larger than {MAX_IMAGE_BYTES // (1024 * 1024)} MB"
+    except ValueError:
+        pass
+    return ''
+
+
+def _copy_body(response: requests.Response, dst):
+    """Stream a response body into dst in 64 KB blocks, enforcing MAX_IMAGE_BYTES.
+    
+    Covers responses without a Content-Length (chunked transfers), which
+    _skip_reason() cannot size up front; raises ValueError once the limit is
+    passed, so at most one block beyond it is ever read.
+    """
+    response.raw.decode_content = True  # Undo any gzip/deflate transfer encoding
+    total = 0
+    while True:
+        block = response.raw.read(64 * 1024)
+        if not block:
+            break
+        total += len(block)
+        if total > MAX_IMAGE_BYTES:
+            raise ValueError(f"larger than {MAX_IMAGE_BYTES // (1024 * 1024)} MB")
+        dst.write(block)
+
+
+def _part_path(filepath: Path) -> Path:
+    """Path an image is written to before os.replace() moves it into place.
+    
+    An interrupted run then never leaves a truncated file under the final
+    name, which DownloadCache would otherwise treat as already saved. No fsync
+    is issued; the rename alone is enough for that.
+    """
+    return filepath.with_name(filepath.name + '.part')
+
+
+def link_or_copy(src: Path, dst: Path):
+    """Give dst the contents of an already saved image without downloading it again.
+    
+    Hard-links where the filesystem allows it and copies otherwise (e.g. across
+    devices, or on Windows without the privilege). Either way the result is
+    moved into place with os.replace(), so an existing dst is overwritten.
+    """
+    tmp_path = _part_path(dst)
+    if tmp_path.exists():
+        tmp_path.unlink()
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def download_image(url: str, filepath: Path, cache: Optional[DownloadCache] = None) -> bool:
+    """Download an image from a URL, recording it in cache if one is given."""
+    try:
+        # Stream straight to disk in 64 KB blocks so large originals are never held in memory
+        UPLOAD_RATE_LIMITER.wait()
+        with SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            skip_reason = _skip_reason(response)
+            if skip_reason:
+                print(f"Skipping image from '{url}': {skip_reason}")
+                return False
+            
+            part_path = _part_path(filepath)
+            try:
+                with open(part_path, 'wb') as f:
+                    _copy_body(response, f)
+            except Exception:
+                # Don't leave a partial body behind (e.g. one cut off for being too large)
+                if part_path.exists():
+                    part_path.unlink()
+                raise
+            os.replace(part_path, filepath)
         
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        if cache is not None:
+            cache.record(url, filepath, response.headers.get('ETag', ''))
         
         return True
     except Exception as e:
@@ -1167,6 +1633,29 @@ def download_image(url: str, filepath: Path) -> bool:
         return False
 
 
+def fetch_image(url: str) -> Optional[Tuple[bytes, str]]:
+    """Download an image into memory, returning its bytes and ETag ('' if none was sent).
+    
+    Nothing is on disk yet, so callers record the image in a DownloadCache only
+    once their save of it has succeeded.
+    """
+    try:
+        buf = BytesIO()
+        UPLOAD_RATE_LIMITER.wait()
+        with SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            skip_reason = _skip_reason(response)
+            if skip_reason:
+                print(f"Skipping image from '{url}': {skip_reason}")
+                return None
+            _copy_body(response, buf)
+        
+        return buf.getvalue(), response.headers.get('ETag', '')
+    except Exception as e:
+        print(f"Error downloading image from '{url}': {e}")
+        return None
+
+
 def convert_svg_to_jpg(svg_path: Path, jpg_path: Path) -> bool:
     """Convert SVG file to JPG format."""
     if not PIL_AVAILABLE:
@@ -1176,13 +1665,15 @@ def convert_svg_to_jpg(svg_path: Path, jpg_path: Path) -> bool:
         # Try using cairosvg if available
         try:
             import cairosvg
-            cairosvg.svg2png(url=str(svg_path), write_to=str(jpg_path.with_suffix('.png')))
-            # Convert PNG to JPG
-            img = Image.open(jpg_path.with_suffix('.png'))
+            # Temporary PNG keeps a .part suffix, so a leftover is never taken for a saved image
+            png_path = jpg_path.with_name(jpg_path.stem + '.png.part')
+            cairosvg.svg2png(url=str(svg_path), write_to=str(png_path))
+            # Convert PNG to JPG; jpg_path may be a .part path, so the format is explicit
+            img = Image.open(png_path)
             if img.mode != 'RGB':
                 img = img.convert('RGB')
-            img.save(jpg_path, quality=95)
-            jpg_path.with_suffix('.png').unlink()  # Remove temporary PNG
+            img.save(jpg_path, 'JPEG', quality=95)
+            png_path.unlink()  # Remove temporary PNG
             return True
         except ImportError:
             # Fallback: try svglib
@@ -1202,6 +1693,89 @@ def convert_svg_to_jpg(svg_path: Path, jpg_path: Path) -> bool:
         return False
 
 
+# JPEGs larger than this (in both dimensions) are reduced while decoding for the overlay,
+# and any image still wider is scaled down to it before the citation is drawn.
+# Matches the thumbnail width, so only originals fetched without a thumbnail are affected.
+MAX_DECODE_SIZE = THUMBNAIL_WIDTH
+
+# Preferred citation fonts, tried in order before falling back to Pillow's default font
+CITATION_FONTS = ["/System/Library/Fonts/Helvetica.ttc", "/System/Library/Fonts/Arial.ttf"]
+
+
+@lru_cache(maxsize=None)
+def _get_citation_font(font_size: int):
+    """Load the citation font at the given size, parsing the font file only once per size."""
+    for font_path in CITATION_FONTS:
+        try:
+            return ImageFont.truetype(font_path, font_size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=256)
+def _citation_band(citation_text: str, width: int, font_size: int):
+    """Render the white band with the citation text centered in it.
+    
+    Cached, so an image reused for several questions (same citation, same
+    width) is only rasterized once. Callers only paste from the result.
+    """
+    font = _get_citation_font(font_size)
+    
+    # Get text bounding box
+    bbox = font.getbbox(citation_text)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    
+    # Add padding
+    padding = 20
+    band = Image.new('RGB', (width, text_height + (padding * 2)), (255, 255, 255))
+    
+    # Draw citation text (centered horizontally) in a single pass
+    ImageDraw.Draw(band).text(((width - text_width) // 2, padding), citation_text, fill=(0, 0, 0), font=font)
+    
+    return band
+
+
+def _compose_citation(img, metadata: Dict):
+    """Return a copy of an opened image with a citation band added below it."""
+    # Convert to RGB if necessary (for PNG with transparency, etc.)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # Create a white background
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        # An RGBA image can serve as its own mask (its alpha band is used), so no split() copy
+        background.paste(img, mask=img if img.mode == 'RGBA' else None)
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+    
+    # Originals without a server-side thumbnail (and PNGs, which draft() cannot reduce)
+    # are scaled to the thumbnail width, so the band, paste and encode handle fewer pixels
+    if img.width > MAX_DECODE_SIZE:
+        height = max(1, round(img.height * MAX_DECODE_SIZE / img.width))
+        img = img.resize((MAX_DECODE_SIZE, height), Image.LANCZOS)
+    
+    # Calculate citation text
+    title = metadata.get('title', metadata.get('filename', 'Image'))
+    author = metadata.get('author', 'Unknown')
+    license_text = metadata.get('license', 'CC')
+    
+    # Format citation: "Title" by Author CC BY 2.0
+    citation_text = f'"{title}" by {author} {license_text}'
+    
+    # Font size scales with the image; each size is loaded only once per run
+    band = _citation_band(citation_text, img.width, max(16, min(img.width, img.height) // 40))
+    
+    # Create overlay image with the original on top and the white citation band below
+    overlay = Image.new('RGB', (img.width, img.height + band.height), (255, 255, 255))
+    overlay.paste(img, (0, 0))
+    overlay.paste(band, (0, img.height))
+    
+    return overlay
+
+
 def add_citation_overlay(image_path: Path, metadata: Dict) -> bool:
     """Add Creative Commons citation overlay to the bottom of an image."""
     if not PIL_AVAILABLE:
@@ -1209,90 +1783,381 @@ def add_citation_overlay(image_path: Path, metadata: Dict) -> bool:
         return False
     
     try:
-        # Convert SVG files to JPG first
-        original_path = image_path
+        # The cited image is written to a .part file and moved into place, so a failed
+        # or interrupted save never leaves a truncated or uncited file under the final name
+        svg_path = None
+        source_path = image_path
+        part_path = _part_path(image_path)
+        
+        # Convert SVG files to JPG first; the SVG is kept until the cited JPG is in place
         if image_path.suffix.lower() == '.svg':
             print(f"  Converting SVG to JPG...")
-            jpg_path = image_path.with_suffix('.jpg')
-            if convert_svg_to_jpg(image_path, jpg_path):
-                image_path.unlink()  # Remove original SVG
-                image_path = jpg_path
-                print(f"  ✓ Converted to {jpg_path.name}")
+            svg_path = image_path
+            image_path = image_path.with_suffix('.jpg')
+            part_path = _part_path(image_path)
+            if convert_svg_to_jpg(svg_path, part_path):
+                source_path = part_path
+                print(f"  ✓ Converted to {image_path.name}")
             else:
                 print(f"  Note: SVG conversion failed, skipping citation overlay")
                 return False
         
-        # Open the image
-        img = Image.open(image_path)
+        # Open the image; for JPEGs, let the decoder downscale by a power of two
+        # (IDCT scaling) while decoding instead of decoding huge originals at full size
+        img = Image.open(source_path)
+        img.draft('RGB', (MAX_DECODE_SIZE, MAX_DECODE_SIZE))
+        overlay = _compose_citation(img, metadata)
         
-        # Convert to RGB if necessary (for PNG with transparency, etc.)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            # Create a white background
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+        # Save the image with citation; the .part name has no image extension
+        image_format = Image.registered_extensions().get(image_path.suffix.lower(), 'JPEG')
+        overlay.save(part_path, image_format, quality=95)
+        os.replace(part_path, image_path)
         
-        # Calculate citation text
-        title = metadata.get('title', metadata.get('filename', 'Image'))
-        author = metadata.get('author', 'Unknown')
-        license_text = metadata.get('license', 'CC')
+        if svg_path is not None:
+            svg_path.unlink()  # Remove original SVG
         
-        # Format citation: "Title" by Author CC BY 2.0
-        citation_text = f'"{title}" by {author} {license_text}'
+        return True
+    except Exception as e:
+        print(f"Error adding citation overlay: {e}")
+        return False
+
+
+def save_with_citation(data: bytes, filepath: Path, metadata: Optional[Dict]) -> bool:
+    """Write downloaded image bytes to filepath, adding the citation overlay if possible.
+    
+    Raster images are decoded straight from memory, so the file is written only
+    once, already cited. Anything Pillow cannot open (e.g. SVG) is written as-is
+    and handed to add_citation_overlay. Returns True if the citation was added.
+    """
+    if PIL_AVAILABLE and metadata:
+        try:
+            img = Image.open(BytesIO(data))
+            img.draft('RGB', (MAX_DECODE_SIZE, MAX_DECODE_SIZE))
+            # The .part name has no image extension, so pass the format explicitly
+            image_format = Image.registered_extensions().get(filepath.suffix.lower(), 'JPEG')
+            part_path = _part_path(filepath)
+            _compose_citation(img, metadata).save(part_path, image_format, quality=95)
+            os.replace(part_path, filepath)
+            return True
+        except Exception:
+            pass
+    
+    try:
+        part_path = _part_path(filepath)
+        with open(part_path, 'wb') as f:
+            f.write(data)
+        os.replace(part_path, filepath)
+    except OSError as e:
+        print(f"Error saving image to '{filepath}': {e}")
+        return False
+    
+    if not metadata:
+        return False
+    return add_citation_overlay(filepath, metadata)
+
+
+# Questions processed concurrently by QuestionImageDownloader unless a script asks otherwise;
+# the shared API_RATE_LIMITER, not the worker count, bounds the Commons API request rate
+MAX_QUESTION_WORKERS = 8
+
+# Downloaded images allowed to wait for or be in the middle of their save at once;
+# workers block before fetching another image until one finishes, capping memory
+MAX_PENDING_SAVES = 8
+
+
+class QuestionImageDownloader:
+    """Download image options (a, b, ...) with citation overlays for a list of questions.
+    
+    Shared by the per-topic scripts; use it as a context manager, which owns
+    the overlay pool. Each downloaded image is held in memory and handed to
+    that CPU-sized pool, which decodes, cites and writes it in a single save
+    while the worker moves on (Pillow releases the GIL while decoding and
+    encoding). A save slot is held from each fetch until its save finishes,
+    so at most MAX_PENDING_SAVES images wait in memory.
+    
+    Optional behaviour, all off by default: with a download_cache, images
+    saved with their citation by an earlier run and unchanged since are
+    kept; with reuse_images, an image another question already saved is
+    linked rather than fetched again; with skip_existing, a question whose
+    options are all already in output_dir is skipped before any network
+    request.
+    """
+    
+    def __init__(self, output_dir: Path, search_cache: SearchCache, options: int = 2,
+                 limit: int = 20, download_cache: Optional[DownloadCache] = None,
+                 reuse_images: bool = False, skip_existing: bool = False,
+                 workers: int = MAX_QUESTION_WORKERS):
+        self.output_dir = output_dir
+        self.search_cache = search_cache
+        self.options = options
+        self.limit = limit
+        self.download_cache = download_cache
+        self.reuse_images = reuse_images
+        self.skip_existing = skip_existing
+        self.workers = workers
+        self._overlay_pool: Optional[ThreadPoolExecutor] = None
+        self._save_slots = threading.BoundedSemaphore(MAX_PENDING_SAVES)
+        # Saved file and its pending save per image URL, for reuse_images
+        self._saved_images: Dict[str, Tuple[Path, Future]] = {}
+        self._saved_lock = threading.Lock()
+    
+    def __enter__(self):
+        self._overlay_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._overlay_pool.shutdown(wait=True)
+        self._overlay_pool = None
+    
+    def _record_when_cited(self, url: str, filepath: Path, etag: str):
+        """Return a save-future callback recording url in download_cache once it is saved with its citation."""
+        def record(save: Future):
+            if save.exception() is None and save.result():
+                self.download_cache.record(url, filepath, etag)
+        return record
+    
+    def download_option(self, option_letter: str, candidate: Dict, output_path: Path) -> Dict:
+        """Fetch one search candidate as an image option and queue its save.
         
-        # Calculate text size and padding
-        draw = ImageDraw.Draw(img)
+        Runs on a worker thread. Returns the attempt for report_attempt(), with
+        'status' one of 'cached', 'reused', 'downloaded' (save queued) or 'failed'.
+        """
+        image_url = candidate['url']
+        attempt = {
+            'option': option_letter,
+            'filename': candidate['title'],
+            'url': image_url,
+            'path': output_path,
+            'metadata': candidate['metadata'],
+            'status': 'failed',
+            'save': None,
+            'reused': None
+        }
         
-        # Try to use a nice font, fallback to default if not available
-        try:
-            # Try system fonts
-            font_size = max(16, min(img.width, img.height) // 40)
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-            except:
-                try:
-                    font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
+        if self.download_cache is not None and self.download_cache.is_current(image_url, output_path):
+            # Saved (with its citation) by a previous run
+            attempt['status'] = 'cached'
+            return attempt
         
-        # Get text bounding box
-        bbox = draw.textbbox((0, 0), citation_text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        if self.reuse_images:
+            # Same image already saved for another question: link it instead of re-fetching
+            with self._saved_lock:
+                earlier = self._saved_images.get(image_url)
+            if earlier is not None:
+                earlier_path, earlier_save = earlier
+                earlier_save.result()
+                # SVGs are replaced by a JPG when cited, so only reuse files still in place
+                if earlier_path.exists():
+                    link_or_copy(earlier_path, output_path)
+                    attempt.update(status='reused', save=earlier_save, reused=earlier_path)
+                    return attempt
         
-        # Add padding
-        padding = 20
-        overlay_height = text_height + (padding * 2)
+        self._save_slots.acquire()
+        fetched = fetch_image(image_url)
+        if fetched is None:
+            self._save_slots.release()
+            return attempt
         
-        # Create overlay image
-        overlay = Image.new('RGB', (img.width, img.height + overlay_height), (255, 255, 255))
+        # Decode from memory, add the citation overlay and write the file once
+        data, etag = fetched
+        save = self._overlay_pool.submit(save_with_citation, data, output_path, attempt['metadata'])
+        save.add_done_callback(lambda _: self._save_slots.release())
+        if self.download_cache is not None:
+            # Only a file saved with its citation counts as done on the next run
+            save.add_done_callback(self._record_when_cited(image_url, output_path, etag))
+        if self.reuse_images:
+            with self._saved_lock:
+                self._saved_images.setdefault(image_url, (output_path, save))
+        attempt.update(status='downloaded', save=save)
+        return attempt
+    
+    @staticmethod
+    def report_attempt(attempt: Dict, indent: str = '  ') -> Tuple[List[str], List[str]]:
+        """Console and log lines for how one option attempt ended, waiting for its save."""
+        status = attempt['status']
+        output_path = attempt['path']
+        metadata = attempt['metadata']
         
-        # Paste original image
-        overlay.paste(img, (0, 0))
+        if status == 'failed':
+            return [], [f"{indent}✗ Download failed\n"]
+        if status == 'cached':
+            return ([f"{indent}✓ Already saved to {output_path} (unchanged since last run)"],
+                    [f"{indent}✓ Already saved (unchanged since last run)\n"])
+        if status == 'reused':
+            name = attempt['reused'].name
+            return ([f"{indent}✓ Reused {name} for {output_path}"],
+                    [f"{indent}✓ Reused image already saved as {name}\n"])
         
-        # Draw citation text on overlay
-        draw_overlay = ImageDraw.Draw(overlay)
+        cited = attempt['save'].result()
+        if not metadata:
+            return ([f"{indent}✓ Saved to {output_path} (metadata not available)"],
+                    [f"{indent}✓ Saved (metadata not available)\n"])
+        if cited:
+            return ([f"{indent}✓ Saved with citation to {output_path}"],
+                    [f"{indent}✓ Successfully saved with citation\n",
+                     f"{indent}Citation: \"{metadata['title']}\" by {metadata['author']} {metadata['license']}\n"])
+        return ([f"{indent}✓ Saved to {output_path} (citation overlay failed)"],
+                [f"{indent}✓ Saved (citation overlay failed)\n"])
+    
+    @staticmethod
+    def attempt_status(attempt: Dict) -> str:
+        """Final outcome of one option attempt: cited, saved, cached, reused or failed."""
+        if attempt['status'] == 'downloaded':
+            return 'cited' if attempt['save'].result() else 'saved'
+        return attempt['status']
+    
+    def process_question(self, q: Dict) -> Dict:
+        """Search and download up to self.options image options for one question.
         
-        # Calculate text position (centered horizontally, at bottom)
-        text_x = (overlay.width - text_width) // 2
-        text_y = img.height + padding
+        Runs on a worker thread and returns each option's attempt for
+        report_question(); the worker does not wait for the queued saves.
+        """
+        q_num = q['number']
         
-        # Draw text in dark gray/black
-        draw_overlay.text((text_x, text_y), citation_text, fill=(0, 0, 0), font=font)
+        # Every option's file name starts the same way, so that part is formatted once
+        base_name = f"question_{q_num:02d}"
         
-        # Save the image with citation
-        overlay.save(image_path, quality=95)
+        if self.skip_existing:
+            # Ignore .part files and empty files left behind by an interrupted save
+            letters = string.ascii_lowercase[:self.options]
+            existing = sorted(
+                path for path in self.output_dir.glob(f"{base_name}_option_[{letters}].*")
+                if path.suffix != '.part' and path.stat().st_size > 0
+            )
+            if len(existing) >= self.options:
+                return {'images_downloaded': 0, 'attempts': [], 'existing': existing}
         
-        return True
-    except Exception as e:
-        print(f"Error adding citation overlay: {e}")
-        return False
+        # Search for images; one API call returns each hit's URL and citation metadata
+        candidates = candidates_with_fallback(q['topic'], q['answer'], limit=self.limit, cache=self.search_cache)
+        
+        attempts = []
+        images_downloaded = 0
+        for candidate in candidates:
+            if images_downloaded >= self.options:
+                break
+            # Candidates are already ordered by license, CC and public domain first
+            if not candidate['url']:
+                continue
+            
+            option_letter = string.ascii_lowercase[images_downloaded]
+            output_path = self.output_dir / f"{base_name}_option_{option_letter}{image_extension(candidate['url'])}"
+            attempt = self.download_option(option_letter, candidate, output_path)
+            attempts.append(attempt)
+            if attempt['status'] != 'failed':
+                images_downloaded += 1
+        
+        return {
+            'images_downloaded': images_downloaded,
+            'attempts': attempts,
+            'existing': []
+        }
+    
+    def report_question(self, q: Dict, result: Dict) -> Tuple[List[str], str]:
+        """Build the console lines and log text for one processed question.
+        
+        Runs on the main thread as results are consumed in order, so waiting here
+        for queued saves never holds up a worker that could be downloading.
+        """
+        q_num = q['number']
+        images_downloaded = result['images_downloaded']
+        
+        console = []
+        log_lines = [
+            f"Question {q_num}: {q['topic']}\n",
+            f"  Question: {q['question'][:100]}...\n",
+            f"  Answer: {q['answer'][:100]}...\n",
+        ]
+        
+        if result['existing']:
+            names = ', '.join(path.name for path in result['existing'])
+            console.append(f"  ✓ Already have {names}, skipped (use --force to re-download)")
+            log_lines.append(f"  ✓ Skipped, already have {names}\n\n")
+            return console, ''.join(log_lines)
+        
+        for attempt in result['attempts']:
+            heading = f"  Downloading option {attempt['option'].upper()}: {attempt['filename']}"
+            console.append(heading)
+            log_lines.append(f"{heading}\n  URL: {attempt['url']}\n")
+            attempt_console, attempt_log = self.report_attempt(attempt)
+            console.extend(attempt_console)
+            log_lines.extend(attempt_log)
+            if attempt['status'] != 'failed':
+                log_lines.append("\n")
+        
+        if images_downloaded == 0:
+            console.append(f"  ✗ No CC-licensed image found for Question {q_num}")
+            log_lines.append(f"  ERROR: No CC-licensed image found\n\n")
+        elif images_downloaded < self.options:
+            console.append(f"  Note: Only {images_downloaded} image(s) downloaded (wanted {self.options} options)")
+            log_lines.append(f"  Note: Only {images_downloaded} image(s) downloaded\n\n")
+        
+        return console, ''.join(log_lines)
+    
+    @classmethod
+    def result_record(cls, q: Dict, attempt: Dict) -> Dict:
+        """Describe one image option as a line of results.jsonl."""
+        return {
+            'question': q['number'],
+            'topic': q['topic'],
+            'option': attempt['option'],
+            'path': attempt['path'].name,
+            'source': attempt['filename'],
+            'url': attempt['url'],
+            'status': cls.attempt_status(attempt),
+            'metadata': attempt['metadata']
+        }
+    
+    def run(self, questions: List[Dict], log, results_index=None) -> Dict:
+        """Process every question, printing and logging each one in question order.
+        
+        Questions are independent and almost entirely network-bound, so
+        self.workers run at once; pool.map yields results in question order,
+        so the console and log read the same as a sequential run. Writes one
+        results.jsonl line per option to results_index if one is given.
+        Returns the totals: images 'downloaded', questions 'failed' and
+        'skipped', and a Counter of option 'statuses'.
+        """
+        totals = {'downloaded': 0, 'failed': 0, 'skipped': 0, 'statuses': Counter()}
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(self.process_question, questions)
+            
+            for idx, (q, result) in enumerate(zip(questions, results), 1):
+                console, log_text = self.report_question(q, result)
+                # One print per question, heading included, rather than one per line
+                print('\n'.join([f"\n[{idx}/{len(questions)}] Processing Question {q['number']}: {q['topic']}"]
+                                + console))
+                log.write(log_text)
+                for attempt in result['attempts']:
+                    record = self.result_record(q, attempt)
+                    totals['statuses'][record['status']] += 1
+                    if results_index is not None:
+                        results_index.write(json_line(record))
+                
+                totals['downloaded'] += result['images_downloaded']
+                if result['existing']:
+                    totals['skipped'] += 1
+                elif result['images_downloaded'] == 0:
+                    totals['failed'] += 1
+                
+                # Progress update every 10 questions
+                if idx % 10 == 0:
+                    print(f"\nProgress: {idx}/{len(questions)} questions processed "
+                          f"({totals['downloaded']} downloaded, {totals['failed']} failed)")
+        
+        return totals
+
+
+# Progress/log templates for the per-image path, bound once instead of rebuilt per image
+_MSG_DOWNLOADING = "  Downloading: {}".format
+_MSG_SAVED_WITH_CITATION = "  ✓ Saved with citation to {}".format
+_MSG_OVERLAY_FAILED = "  ✓ Saved to {} (citation overlay failed)".format
+_MSG_NO_METADATA = "  ✓ Saved to {} (metadata not available)".format
+_LOG_DOWNLOADING = "  Downloading: {}\n  URL: {}\n".format
+_LOG_SAVED_WITH_CITATION = '  ✓ Successfully saved with citation\n  Citation: "{title}" by {author} {license}\n\n'.format
+_LOG_OVERLAY_FAILED = "  ✓ Saved (citation overlay failed)\n\n"
+_LOG_NO_METADATA = "  ✓ Saved (metadata not available)\n\n"
+_LOG_DOWNLOAD_FAILED = "  ✗ Download failed\n"
 
 
 def main():
@@ -1312,13 +2177,21 @@ def main():
     downloaded_count = 0
     failed_count = 0
     
+    # Final saved file per image URL, so questions that match the same image share one download
+    saved_images: Dict[str, Path] = {}
+    
     print(f"Starting download process for {len(questions)} questions...")
     print(f"Output directory: {output_dir.absolute()}\n")
     
-    with open(log_file, 'w', encoding='utf-8') as log:
+    # Single background worker keeps at most one search in flight ahead of the current question
+    with ThreadPoolExecutor(max_workers=1) as prefetch_pool, open(log_file, 'w', encoding='utf-8') as log:
         log.write("Question Image Download Log\n")
         log.write("=" * 50 + "\n\n")
         
+        if questions:
+            first_q = questions[0]
+            next_search = prefetch_pool.submit(candidates_with_fallback, first_q['topic'], first_q['answer'], 10)
+        
         for idx, q in enumerate(questions, 1):
             q_num = q['number']
             topic = q['topic']
@@ -1328,24 +2201,15 @@ def main():
             log.write(f"  Question: {q['question'][:100]}...\n")
             log.write(f"  Answer: {q['answer'][:100]}...\n")
             
-            # Search for images
-            search_results = search_wikimedia_commons(topic, limit=10)
+            # Wait for this question's search (started while the previous question downloaded),
+            # then immediately start the next question's search so it overlaps with this download
+            search_results = next_search.result()
+            if idx < len(questions):
+                next_q = questions[idx]
+                next_search = prefetch_pool.submit(candidates_with_fallback, next_q['topic'], next_q['answer'], 10)
             
-            if not search_results:
-                # Try alternative search terms
-                alt_terms = [
-                    topic.replace(' ', '_'),
-                    topic.lower(),
-                    q['answer'].split()[0] if q['answer'] else topic
-                ]
-                for alt_term in alt_terms:
-                    search_results = search_wikimedia_commons(alt_term, limit=10)
-                    if search_results:
-                        break
-            
-            # Try to find a CC-licensed image
-            # Note: Most Wikimedia Commons images are CC-licensed, so we'll try to download
-            # and skip the license check if it fails (to speed things up)
+            # Candidates are already ordered by license, and each carries its URL and
+            # citation metadata, so no further API calls are needed
             image_found = False
             
             # If Wikimedia Commons fails, try Unsplash as fallback
@@ -1391,58 +2255,57 @@ def main():
             # Process Wikimedia Commons results if we have them
             if search_results:
                 for result in search_results:
-                    filename = result.get('title', '')
-                    
-                    if not filename.startswith('File:'):
-                        continue
-                    
-                    # Try to get image URL directly (most Wikimedia Commons images are CC)
-                    image_url = get_image_url(filename)
+                    filename = result['title']
+                    image_url = result['url']
                     
                     if image_url:
                         # Determine file extension
-                        ext = '.jpg'
-                        if '.png' in image_url.lower() or '.png' in filename.lower():
-                            ext = '.png'
-                        elif '.gif' in image_url.lower() or '.gif' in filename.lower():
-                            ext = '.gif'
-                        elif '.svg' in image_url.lower() or '.svg' in filename.lower():
-                            ext = '.svg'
+                        ext = image_extension(image_url)
                         
                         output_path = output_dir / f"question_{q_num:02d}{ext}"
                         
-                        print(f"  Downloading: {filename}")
-                        log.write(f"  Downloading: {filename}\n")
-                        log.write(f"  URL: {image_url}\n")
+                        print(_MSG_DOWNLOADING(filename))
+                        log.write(_LOG_DOWNLOADING(filename, image_url))
+                        
+                        # Same image already saved for an earlier question: link it instead of re-fetching
+                        saved_path = saved_images.get(image_url)
+                        if saved_path and saved_path.exists():
+                            output_path = output_path.with_suffix(saved_path.suffix)
+                            link_or_copy(saved_path, output_path)
+                            print(f"  ✓ Reused {saved_path.name} for {output_path}")
+                            log.write(f"  ✓ Reused image already saved as {saved_path.name}\n\n")
+                            downloaded_count += 1
+                            image_found = True
+                            break
                         
                         if download_image(image_url, output_path):
-                            # Get metadata and add citation overlay
-                            metadata = get_image_metadata(filename)
+                            saved_images[image_url] = output_path
+                            # Add the citation overlay from the metadata fetched with the search
+                            metadata = result['metadata']
                             if metadata:
                                 if add_citation_overlay(output_path, metadata):
-                                    print(f"  ✓ Saved with citation to {output_path}")
-                                    log.write(f"  ✓ Successfully saved with citation\n")
-                                    log.write(f"  Citation: \"{metadata['title']}\" by {metadata['author']} {metadata['license']}\n\n")
+                                    print(_MSG_SAVED_WITH_CITATION(output_path))
+                                    log.write(_LOG_SAVED_WITH_CITATION(**metadata))
                                 else:
-                                    print(f"  ✓ Saved to {output_path} (citation overlay failed)")
-                                    log.write(f"  ✓ Saved (citation overlay failed)\n\n")
+                                    print(_MSG_OVERLAY_FAILED(output_path))
+                                    log.write(_LOG_OVERLAY_FAILED)
                             else:
-                                print(f"  ✓ Saved to {output_path} (metadata not available)")
-                                log.write(f"  ✓ Saved (metadata not available)\n\n")
+                                print(_MSG_NO_METADATA(output_path))
+                                log.write(_LOG_NO_METADATA)
+                            # SVGs are replaced by a JPG during the overlay step
+                            if not output_path.exists():
+                                saved_images[image_url] = output_path.with_suffix('.jpg')
                             downloaded_count += 1
                             image_found = True
                             break
                         else:
-                            log.write(f"  ✗ Download failed\n")
+                            log.write(_LOG_DOWNLOAD_FAILED)
             
             if not image_found:
                 print(f"  ✗ No CC-licensed image found for Question {q_num}")
                 log.write(f"  ERROR: No CC-licensed image found\n\n")
                 failed_count += 1
             
-            # Be polite to the API
-            time.sleep(0.5)
-            
             # Progress update every 10 questions
             if idx % 10 == 0:
                 print(f"\nProgress: {idx}/{len(questions)} questions processed ({downloaded_count} downloaded, {failed_count} failed)")
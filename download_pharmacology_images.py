@@ -6,536 +6,292 @@ Downloads 2 image options per question using provided search queries.
 """
 
 import re
-import os
 import json
-import requests
+import argparse
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-import time
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    print("Warning: Pillow not installed. Citation overlays will be skipped.")
-    print("Install with: pip3 install --break-system-packages Pillow")
-
-# Import functions from the main script
+# Import functions from the main script; Pillow is optional there, and it warns
+# once at import if it is missing
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 from download_cc_images import (
-    search_wikimedia_commons,
-    get_image_url,
-    get_image_metadata,
-    download_image,
-    add_citation_overlay,
-    extract_topic
+    API_RATE_LIMITER,
+    SESSION_POOL_SIZE,
+    SearchCache,
+    search_image_candidates,
+    QuestionImageDownloader,
+    image_extension
 )
 
-# Pharmacology questions with their search queries
-PHARMACOLOGY_QUESTIONS = [
-    {
-        'number': 1,
-        'topic': 'Cirrhosis & Protein Binding',
-        'queries': [
-            'effect of hypoalbuminemia on volume of distribution',
-            'pharmacokinetics of highly protein bound drugs in liver disease'
-        ]
-    },
-    {
-        'number': 2,
-        'topic': 'Heart Failure & Drug Distribution',
-        'queries': [
-            'how edema affects volume of distribution for hydrophilic drugs',
-            'pharmacokinetics in heart failure fluid overload'
-        ]
-    },
-    {
-        'number': 3,
-        'topic': 'Sudden Drug Toxicity & Kinetics',
-        'queries': [
-            'zero-order vs first-order elimination kinetics',
-            'drugs with zero-order kinetics examples'
-        ]
-    },
-    {
-        'number': 4,
-        'topic': 'Aspirin Overdose Kinetics',
-        'queries': [
-            'aspirin overdose shifts from first-order to zero-order kinetics',
-            'salicylate metabolism saturation'
-        ]
-    },
-    {
-        'number': 5,
-        'topic': 'Cyanide Poisoning Mechanism',
-        'queries': [
-            'cyanide poisoning mechanism cytochrome oxidase',
-            'noncompetitive vs competitive inhibition Vmax Km'
-        ]
-    },
-    {
-        'number': 6,
-        'topic': 'Antifreeze & Ethanol Treatment',
-        'queries': [
-            'ethanol for ethylene glycol poisoning mechanism',
-            'competitive inhibition alcohol dehydrogenase fomepizole'
-        ]
-    },
-    {
-        'number': 7,
-        'topic': 'Buprenorphine & Withdrawal',
-        'queries': [
-            'buprenorphine precipitated withdrawal mechanism',
-            'buprenorphine high affinity partial agonist'
-        ]
-    },
-    {
-        'number': 8,
-        'topic': 'Potency vs. Efficacy',
-        'queries': [
-            'pharmacology potency vs efficacy graph',
-            'EC50 and Emax definition pharmacology'
-        ]
-    },
-    {
-        'number': 9,
-        'topic': 'Aspirin Overdose & Bicarbonate',
-        'queries': [
-            'sodium bicarbonate for aspirin overdose mechanism',
-            'ion trapping weak acid excretion'
-        ]
-    },
-    {
-        'number': 10,
-        'topic': 'Amphetamine Overdose & Urine pH',
-        'queries': [
-            'acidification of urine for amphetamine overdose',
-            'ion trapping weak base excretion'
-        ]
-    },
-    {
-        'number': 11,
-        'topic': 'pKa and Drug Ionization',
-        'queries': [
-            'henderson hasselbalch equation for weak base',
-            'drug absorption pKa vs pH'
-        ]
-    },
-    {
-        'number': 12,
-        'topic': 'Malignant Hyperthermia',
-        'queries': [
-            'malignant hyperthermia triggers and mechanism',
-            'dantrolene mechanism of action malignant hyperthermia'
-        ]
-    },
-    {
-        'number': 13,
-        'topic': 'Inhaled Anesthetics & Solubility',
-        'queries': [
-            'inhaled anesthetic blood gas partition coefficient explained',
-            'desflurane fast onset low solubility'
-        ]
-    },
-    {
-        'number': 14,
-        'topic': 'Cirrhosis & Warfarin',
-        'queries': [
-            'warfarin metabolism in liver cirrhosis',
-            'effect of hepatic dysfunction on CYP450 metabolism'
-        ]
-    },
-    {
-        'number': 15,
-        'topic': 'Vancomycin & Obesity',
-        'queries': [
-            'vancomycin loading dose in obesity',
-            'loading dose vs maintenance dose Vd clearance'
-        ]
-    },
-    {
-        'number': 16,
-        'topic': 'Digoxin & Kidney Disease',
-        'queries': [
-            'digoxin toxicity in chronic kidney disease',
-            'digoxin renal clearance and pharmacokinetics'
-        ]
-    },
-    {
-        'number': 17,
-        'topic': 'Warfarin & Rifampin',
-        'queries': [
-            'rifampin warfarin interaction mechanism',
-            'rifampin as a CYP450 inducer'
-        ]
-    },
-    {
-        'number': 18,
-        'topic': 'Elderly & Diazepam',
-        'queries': [
-            'Phase 1 vs Phase 2 metabolism in elderly',
-            'why avoid diazepam in elderly LOT benzodiazepines'
-        ]
-    },
-    {
-        'number': 19,
-        'topic': 'Warfarin & Ciprofloxacin',
-        'queries': [
-            'ciprofloxacin warfarin interaction CYP',
-            'common CYP450 inhibitors'
-        ]
-    },
-    {
-        'number': 20,
-        'topic': 'Theophylline & Ciprofloxacin',
-        'queries': [
-            'theophylline ciprofloxacin interaction mechanism',
-            'theophylline narrow therapeutic index CYP1A2'
-        ]
-    },
-    {
-        'number': 21,
-        'topic': 'Isoniazid & Lupus',
-        'queries': [
-            'slow acetylators isoniazid drug induced lupus',
-            'N-acetyltransferase polymorphism isoniazid'
-        ]
-    },
-    {
-        'number': 22,
-        'topic': 'Sweating Neurotransmitter',
-        'queries': [
-            'neurotransmitter for sweat glands sympathetic cholinergic',
-            'anticholinergic drugs for hyperhidrosis'
-        ]
-    },
-    {
-        'number': 23,
-        'topic': 'Tamsulosin & Dizziness',
-        'queries': [
-            'tamsulosin orthostatic hypotension mechanism',
-            'alpha-1 blocker first dose effect'
-        ]
-    },
-    {
-        'number': 24,
-        'topic': 'Asthma Rescue Inhaler',
-        'queries': [
-            'albuterol mechanism of action asthma',
-            'beta 2 receptor function lungs'
-        ]
-    },
-    {
-        'number': 25,
-        'topic': 'Anaphylaxis Treatment',
-        'queries': [
-            'epinephrine for anaphylaxis IM vs subcutaneous',
-            'alpha-1 and beta-2 effects of epinephrine in anaphylaxis'
-        ]
-    },
-    {
-        'number': 26,
-        'topic': 'Post-op Urinary Retention',
-        'queries': [
-            'bethanechol mechanism for urinary retention',
-            'muscarinic agonists vs antagonists bladder'
-        ]
-    },
-    {
-        'number': 27,
-        'topic': 'Organophosphate Poisoning',
-        'queries': [
-            'atropine for organophosphate poisoning mechanism',
-            'atropine vs pralidoxime for organophosphate poisoning'
-        ]
-    },
-    {
-        'number': 28,
-        'topic': 'Fenoldopam Mechanism',
-        'queries': [
-            'fenoldopam mechanism of action hypertensive emergency',
-            'D1 receptor agonists effects renal blood flow'
-        ]
-    },
-    {
-        'number': 29,
-        'topic': 'Famotidine Mechanism',
-        'queries': [
-            'famotidine H2 blocker mechanism of action',
-            'H2 blockers vs proton pump inhibitors mechanism'
-        ]
-    },
-    {
-        'number': 30,
-        'topic': 'Donepezil Mechanism',
-        'queries': [
-            'donepezil mechanism of action Alzheimer\'s',
-            'acetylcholinesterase inhibitors side effects'
-        ]
-    },
-    {
-        'number': 31,
-        'topic': 'Dobutamine in Heart Failure',
-        'queries': [
-            'dobutamine mechanism of action heart failure',
-            'beta 1 agonist effects contractility'
-        ]
-    },
-    {
-        'number': 32,
-        'topic': 'Metoclopramide Mechanism',
-        'queries': [
-            'metoclopramide mechanism of action gastroparesis',
-            'metoclopramide D2 antagonist extrapyramidal side effects'
-        ]
-    },
-    {
-        'number': 33,
-        'topic': 'Methylphenidate Mechanism',
-        'queries': [
-            'methylphenidate mechanism of action ADHD',
-            'DAT and NET reuptake inhibitors'
-        ]
-    },
-    {
-        'number': 34,
-        'topic': 'MAOI & Cocaine Interaction',
-        'queries': [
-            'MAOI and cocaine interaction hypertensive crisis',
-            'cocaine vs MAOI effect on norepinephrine'
-        ]
-    },
-    {
-        'number': 35,
-        'topic': 'Septic Shock Vasopressor',
-        'queries': [
-            'norepinephrine for septic shock mechanism',
-            'first line vasopressor septic shock'
-        ]
-    },
-    {
-        'number': 36,
-        'topic': 'Botulinum Toxin Mechanism',
-        'queries': [
-            'botulinum toxin mechanism of action neuromuscular junction',
-            'SNARE proteins and acetylcholine release'
-        ]
-    },
-    {
-        'number': 37,
-        'topic': 'Pheochromocytoma Pre-op',
-        'queries': [
-            'pheochromocytoma preoperative management alpha blockade',
-            'why alpha blockade before beta blockade pheochromocytoma'
-        ]
-    },
-    {
-        'number': 38,
-        'topic': 'Digoxin in Elderly',
-        'queries': [
-            'digoxin volume of distribution in elderly',
-            'age related changes in drug distribution'
-        ]
-    },
-    {
-        'number': 39,
-        'topic': 'NSAID & GI Bleed',
-        'queries': [
-            'NSAID mechanism of GI bleed',
-            'prostaglandins gastric protection COX-1'
-        ]
-    },
-    {
-        'number': 40,
-        'topic': 'Diphenhydramine in Elderly',
-        'queries': [
-            'diphenhydramine anticholinergic effects elderly',
-            'Beers criteria anticholinergic drugs'
-        ]
-    },
-    {
-        'number': 41,
-        'topic': 'Cirrhosis & Free Drug',
-        'queries': [
-            'effect of hypoalbuminemia on highly protein bound drugs',
-            'free drug concentration vs bound drug in liver disease'
-        ]
-    },
-    {
-        'number': 42,
-        'topic': 'Diazepam in Elderly',
-        'queries': [
-            'diazepam active metabolites and aging',
-            'Phase 1 metabolism decline in elderly'
-        ]
-    },
-    {
-        'number': 43,
-        'topic': 'Amitriptyline & Orthostasis',
-        'queries': [
-            'amitriptyline orthostatic hypotension mechanism',
-            'tricyclic antidepressant side effects alpha 1 blockade'
-        ]
-    },
-    {
-        'number': 44,
-        'topic': 'Varenicline Mechanism',
-        'queries': [
-            'varenicline mechanism of action smoking cessation',
-            'nicotinic partial agonist mechanism'
-        ]
-    },
-]
+# Pharmacology questions (number, topic, and one search query per image option)
+QUESTIONS_FILE = Path(__file__).parent / "pharmacology_questions.json"
+
+
+# Commons file titles that are still images, by extension; anchored at the end so that
+# a title like 'File:Receptor.png.webm' or 'File:Scan.jpg.pdf' is rejected
+_IMAGE_TITLE_RE = re.compile(r'\.(?:jpe?g|png|gif|svg|webp|bmp|tiff?)$', re.IGNORECASE)
+
+# Progress/log templates for the per-image path, bound once instead of rebuilt per image
+_MSG_DOWNLOADING = "    Downloading: {}".format
+_LOG_OPTION = "  Option {}: {}\n    Query: {}\n    URL: {}\n".format
+
+# Outcome lines are indented under each option's "Downloading" line
+_OUTCOME_INDENT = '    '
+
+# Number of image options searched and downloaded concurrently (override with --workers);
+# the shared API_RATE_LIMITER (--rate), not the worker count, bounds the API request rate
+MAX_WORKERS = 8
+
+
+def process_option(q_num: int, option_letter: str, query: str,
+                   downloader: QuestionImageDownloader, force: bool = False) -> Dict:
+    """Search for one query and download the first suitable image as one option.
+    
+    Runs on a worker thread, so console and log output are collected and
+    returned for report_question() to put together in question order. Each
+    search returns its hits' image URLs and citation metadata too, and
+    searches already in the downloader's search cache (from this or an
+    earlier run) are not repeated. downloader.download_option() fetches the
+    image and queues its cited save, so the worker is free for the next
+    download while it renders. Unless force is set, an option already saved
+    in the output directory by an earlier run is skipped before any network
+    request.
+    """
+    output_dir = downloader.output_dir
+    search_cache = downloader.search_cache
+    
+    if not force:
+        # Ignore .part files and empty files left behind by an interrupted save
+        existing = [
+            path for path in output_dir.glob(f"question_{q_num:02d}_option_{option_letter}.*")
+            if path.suffix != '.part' and path.stat().st_size > 0
+        ]
+        if existing:
+            name = existing[0].name
+            return {
+                'downloaded': True,
+                'skipped': True,
+                'saved': None,
+                'option': option_letter,
+                'query': query,
+                'path': name,
+                'console': [f"  ✓ Option {option_letter.upper()} already saved as {name}, skipped (use --force to re-download)"],
+                'log': [f"  Option {option_letter.upper()}: skipped, already saved as {name}\n"]
+            }
+    
+    console = [f"  Searching for option {option_letter.upper()}: {query}"]
+    log_lines = []
+    
+    # Search for images using this query
+    search_results = search_image_candidates(query, limit=10, cache=search_cache)
+    
+    if not search_results:
+        # Broaden to the first 3 words. Commons search ignores case and treats '_' as a
+        # space, so lowercased or underscored variants of the query would only repeat it;
+        # and since all words must match, "query OR first 3 words" finds the same as this.
+        broader = ' '.join(query.split()[:3])
+        if broader.lower() != query.strip().lower():
+            search_results = search_image_candidates(broader, limit=10, cache=search_cache)
+    
+    # Try to find a suitable image
+    saved = None
+    
+    if search_results:
+        for result in search_results:
+            filename = result['title']
+            
+            # Only accept titles ending in an image file extension (skips PDFs, documents, etc.)
+            if not _IMAGE_TITLE_RE.search(filename):
+                continue
+            
+            image_url = result['url']
+            
+            if image_url:
+                # Determine file extension
+                ext = image_extension(image_url)
+                
+                # Create option filename
+                output_path = output_dir / f"question_{q_num:02d}_option_{option_letter}{ext}"
+                
+                console.append(_MSG_DOWNLOADING(filename))
+                log_lines.append(_LOG_OPTION(option_letter.upper(), filename, query, image_url))
+                
+                # Cited with the metadata fetched with the search
+                attempt = downloader.download_option(option_letter, result, output_path)
+                if attempt['status'] != 'failed':
+                    saved = attempt
+                    break
+                log_lines.extend(downloader.report_attempt(attempt, _OUTCOME_INDENT)[1])
+    
+    if saved is None:
+        console.append(f"    ✗ No image found for query: {query}")
+        log_lines.append(f"    ✗ No image found for query: {query}\n")
+    
+    return {
+        'downloaded': saved is not None,
+        'skipped': False,
+        'saved': saved,
+        'option': option_letter,
+        'query': query,
+        'console': console,
+        'log': log_lines
+    }
+
+
+def report_question(q: Dict, options: List[Dict]) -> Tuple[List[str], str, int]:
+    """Combine a question's option results into its console lines, log text and image count.
+    
+    Options skipped because they were already saved count as downloaded.
+    Runs on the main thread, waiting for each option's queued save.
+    """
+    q_num = q['number']
+    images_downloaded = sum(1 for option in options if option['downloaded'])
+    
+    console = []
+    log_lines = [
+        f"Question {q_num}: {q['topic']}\n",
+        f"  Search queries: {q['queries']}\n",
+    ]
+    for option in options:
+        console.extend(option['console'])
+        log_lines.extend(option['log'])
+        
+        if option['saved'] is not None:
+            saved_console, saved_log = QuestionImageDownloader.report_attempt(option['saved'], _OUTCOME_INDENT)
+            console.extend(saved_console)
+            log_lines.extend(saved_log)
+    
+    if images_downloaded == 0:
+        console.append(f"  ✗ No CC-licensed images found for Question {q_num}")
+        log_lines.append("  ERROR: No CC-licensed images found\n\n")
+    elif images_downloaded < 2:
+        console.append(f"  Note: Only {images_downloaded} image(s) downloaded (wanted 2 options)")
+        log_lines.append(f"  Note: Only {images_downloaded} image(s) downloaded\n\n")
+    else:
+        log_lines.append("  ✓ Successfully downloaded 2 images\n\n")
+    
+    return console, ''.join(log_lines), images_downloaded
+
+
+def manifest_entry(q: Dict, options: List[Dict]) -> Dict:
+    """Describe one question and the outcome of each of its options for download_log.json."""
+    entries = []
+    for option in options:
+        entry = {'option': option['option'], 'query': option['query']}
+        saved = option['saved']
+        if option['skipped']:
+            entry.update(status='skipped', path=option['path'])
+        elif saved is None:
+            entry['status'] = 'not_found'
+        else:
+            entry.update(
+                status=QuestionImageDownloader.attempt_status(saved),
+                path=saved['path'].name,
+                source=saved['filename'],
+                url=saved['url'],
+                metadata=saved['metadata']
+            )
+        entries.append(entry)
+    
+    return {'question': q['number'], 'topic': q['topic'], 'options': entries}
 
 
 def main():
     """Main function to process questions and download images."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--force', action='store_true',
+                        help="re-download image options that were already saved")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help=f"image options processed concurrently, 1-{SESSION_POOL_SIZE} (default: {MAX_WORKERS})")
+    parser.add_argument('--rate', type=float, default=API_RATE_LIMITER.rate,
+                        help=f"Commons API requests per second (default: {API_RATE_LIMITER.rate:g})")
+    parser.add_argument('--cache-dir', type=Path, default=None,
+                        help="directory for the search cache (default: the output directory)")
+    args = parser.parse_args()
+    
+    if not 1 <= args.workers <= SESSION_POOL_SIZE:
+        parser.error(f"--workers must be between 1 and {SESSION_POOL_SIZE}")
+    if args.rate <= 0:
+        parser.error("--rate must be positive")
+    API_RATE_LIMITER.set_rate(args.rate)
+    
     print("Processing pharmacology questions...")
-    print(f"Found {len(PHARMACOLOGY_QUESTIONS)} questions")
+    with open(QUESTIONS_FILE, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+    print(f"Found {len(questions)} questions")
     
     # Create output directory
     output_dir = Path("pharmacology_images")
     output_dir.mkdir(exist_ok=True)
     
-    # Create a log file
+    # Create a log file, plus a JSON manifest of every option written once at the end
     log_file = output_dir / "download_log.txt"
+    manifest_file = output_dir / "download_log.json"
+    manifest = []
+    
+    # Search results from earlier runs, so reruns only query what is new
+    cache_dir = args.cache_dir or output_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    search_cache = SearchCache(cache_dir / ".candidates_cache.json")
     
     downloaded_count = 0
     failed_count = 0
+    skipped_count = 0
     
-    print(f"Starting download process for {len(PHARMACOLOGY_QUESTIONS)} questions...")
+    print(f"Starting download process for {len(questions)} questions...")
     print(f"Output directory: {output_dir.absolute()}\n")
     
-    with open(log_file, 'w', encoding='utf-8') as log:
+    # Options are independent and almost entirely network-bound, so several run at once;
+    # pool.map yields results in job order, so the console and log read the same as a
+    # sequential run. Only the main thread writes the log, one block per question; line
+    # buffering means everything logged so far is on disk if the run is interrupted.
+    # The downloader fetches each image and cites it on its own overlay pool.
+    with QuestionImageDownloader(output_dir, search_cache) as downloader, \
+            ThreadPoolExecutor(max_workers=args.workers) as pool, \
+            open(log_file, 'w', encoding='utf-8', buffering=1) as log:
         log.write("Pharmacology Question Image Download Log\n")
         log.write("=" * 50 + "\n\n")
         
-        for idx, q in enumerate(PHARMACOLOGY_QUESTIONS, 1):
-            q_num = q['number']
-            topic = q['topic']
-            queries = q['queries']
-            
-            print(f"\n[{idx}/{len(PHARMACOLOGY_QUESTIONS)}] Processing Question {q_num}: {topic}")
-            log.write(f"Question {q_num}: {topic}\n")
-            log.write(f"  Search queries: {queries}\n")
-            
-            # Process each query to get one image (2 queries = 2 images)
-            images_downloaded = 0
-            
-            for query_idx, query in enumerate(queries):
-                if images_downloaded >= 2:  # Stop after 2 images
-                    break
-                
-                option_letter = 'a' if query_idx == 0 else 'b'
-                print(f"  Searching for option {option_letter.upper()}: {query}")
-                
-                # Search for images using this query
-                search_results = search_wikimedia_commons(query, limit=10)
-                
-                if not search_results:
-                    # Try alternative search terms
-                    alt_terms = [
-                        query.replace(' ', '_'),
-                        query.lower(),
-                        ' '.join(query.split()[:3])  # First 3 words
-                    ]
-                    for alt_term in alt_terms:
-                        search_results = search_wikimedia_commons(alt_term, limit=10)
-                        if search_results:
-                            break
-                
-                # Try to find a suitable image
-                image_found = False
-                
-                if search_results:
-                    for result in search_results:
-                        filename = result.get('title', '')
-                        
-                        if not filename.startswith('File:'):
-                            continue
-                        
-                        # Skip PDFs and other non-image files
-                        filename_lower = filename.lower()
-                        if any(ext in filename_lower for ext in ['.pdf', '.doc', '.docx', '.txt', '.zip', '.tar', '.gz']):
-                            continue
-                        
-                        # Only accept image file extensions
-                        if not any(ext in filename_lower for ext in ['.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.bmp', '.tiff', '.tif']):
-                            continue
-                        
-                        # Try to get image URL directly
-                        image_url = get_image_url(filename)
-                        
-                        if image_url:
-                            # Determine file extension
-                            ext = '.jpg'
-                            if '.png' in image_url.lower() or '.png' in filename.lower():
-                                ext = '.png'
-                            elif '.gif' in image_url.lower() or '.gif' in filename.lower():
-                                ext = '.gif'
-                            elif '.svg' in image_url.lower() or '.svg' in filename.lower():
-                                ext = '.svg'
-                            
-                            # Create option filename
-                            output_path = output_dir / f"question_{q_num:02d}_option_{option_letter}{ext}"
-                            
-                            print(f"    Downloading: {filename}")
-                            log.write(f"  Option {option_letter.upper()}: {filename}\n")
-                            log.write(f"    Query: {query}\n")
-                            log.write(f"    URL: {image_url}\n")
-                            
-                            if download_image(image_url, output_path):
-                                # Get metadata and add citation overlay
-                                metadata = get_image_metadata(filename)
-                                if metadata:
-                                    if add_citation_overlay(output_path, metadata):
-                                        print(f"    ✓ Saved with citation to {output_path}")
-                                        log.write(f"    ✓ Successfully saved with citation\n")
-                                        log.write(f"    Citation: \"{metadata['title']}\" by {metadata['author']} {metadata['license']}\n")
-                                    else:
-                                        print(f"    ✓ Saved to {output_path} (citation overlay failed)")
-                                        log.write(f"    ✓ Saved (citation overlay failed)\n")
-                                else:
-                                    print(f"    ✓ Saved to {output_path} (metadata not available)")
-                                    log.write(f"    ✓ Saved (metadata not available)\n")
-                                downloaded_count += 1
-                                images_downloaded += 1
-                                image_found = True
-                                break
-                            else:
-                                log.write(f"    ✗ Download failed\n")
-                
-                if not image_found:
-                    print(f"    ✗ No image found for query: {query}")
-                    log.write(f"    ✗ No image found for query: {query}\n")
+        # Each question's two options are independent searches, so they run as separate jobs;
+        # option A takes the first query and option B the second
+        option_jobs = [(q['number'], letter, query) for q in questions for letter, query in zip('ab', q['queries'])]
+        results = pool.map(lambda job: process_option(*job, downloader, args.force), option_jobs)
+        
+        for idx, q in enumerate(questions, 1):
+            options = [next(results) for _ in zip('ab', q['queries'])]
+            skipped_count += sum(1 for option in options if option['skipped'])
+            console, log_text, images_downloaded = report_question(q, options)
+            manifest.append(manifest_entry(q, options))
+            print(f"\n[{idx}/{len(questions)}] Processing Question {q['number']}: {q['topic']}")
+            for line in console:
+                print(line)
+            log.write(log_text)
             
+            downloaded_count += images_downloaded
             if images_downloaded == 0:
-                print(f"  ✗ No CC-licensed images found for Question {q_num}")
-                log.write(f"  ERROR: No CC-licensed images found\n\n")
                 failed_count += 1
-            elif images_downloaded < 2:
-                print(f"  Note: Only {images_downloaded} image(s) downloaded (wanted 2 options)")
-                log.write(f"  Note: Only {images_downloaded} image(s) downloaded\n\n")
-            else:
-                log.write(f"  ✓ Successfully downloaded 2 images\n\n")
-            
-            # Be polite to the API
-            time.sleep(0.5)
             
             # Progress update every 10 questions
             if idx % 10 == 0:
-                print(f"\nProgress: {idx}/{len(PHARMACOLOGY_QUESTIONS)} questions processed ({downloaded_count} downloaded, {failed_count} failed)")
+                print(f"\nProgress: {idx}/{len(questions)} questions processed ({downloaded_count} downloaded, {failed_count} failed)")
+    
+    search_cache.flush()
+    
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
     
     print(f"\n{'='*50}")
     print(f"Download complete!")
-    print(f"Successfully downloaded: {downloaded_count}/{len(PHARMACOLOGY_QUESTIONS) * 2} images (target: 2 per question)")
-    print(f"Failed: {failed_count}/{len(PHARMACOLOGY_QUESTIONS)}")
+    print(f"Successfully downloaded: {downloaded_count}/{len(questions) * 2} images (target: 2 per question)")
+    print(f"Failed: {failed_count}/{len(questions)}")
+    if skipped_count:
+        print(f"Skipped (already downloaded): {skipped_count}/{len(questions) * 2} images")
     print(f"\nImages saved to: {output_dir.absolute()}")
     print(f"Log file: {log_file.absolute()}")
+    print(f"Manifest: {manifest_file.absolute()}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -4,11 +4,76 @@ Script to convert existing SVG files to JPG and add citations.
 Processes SVG files in neurology_images folder.
 """
 
+import os
+import re
 import sys
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 sys.path.insert(0, str(Path(__file__).parent))
 from download_cc_images import get_image_metadata, add_citation_overlay, convert_svg_to_jpg
 
+# Each question's log block starts with "Question N: ...", followed by a
+# "Downloading option A: File:..." line for every image option it tried
+_LOG_ENTRY_RE = re.compile(r'^Question (\d+):|^\s*Downloading option ([A-Za-z]): (File:[^\n]+)', re.MULTILINE)
+
+# Concurrent metadata lookups; the shared API_RATE_LIMITER, not this count, bounds the request rate
+METADATA_WORKERS = 8
+
+def read_log_filenames(log_file: Path) -> Dict[str, str]:
+    """Map each image stem in a download log (e.g. question_01_option_a) to its Wikimedia filename.
+    
+    The log is read and scanned once; a later attempt at the same option
+    (after a failed download) replaces the earlier one.
+    """
+    filenames = {}
+    if not log_file.exists():
+        return filenames
+    
+    q_num = None
+    for match in _LOG_ENTRY_RE.finditer(log_file.read_text(encoding='utf-8')):
+        if match.group(1):
+            q_num = int(match.group(1))
+        elif q_num is not None:
+            filenames[f"question_{q_num:02d}_option_{match.group(2).lower()}"] = match.group(3).strip()
+    return filenames
+
+def lookup_metadata(wikimedia_filename: Optional[str]) -> Optional[Dict]:
+    """Get citation metadata for the filename recorded in the log, if there is one."""
+    if wikimedia_filename:
+        return get_image_metadata(wikimedia_filename)
+    return None
+
+def convert_svg(svg_path: Path, metadata: Optional[Dict]) -> Tuple[bool, List[str]]:
+    """Convert one SVG to JPG, add its citation and remove the SVG.
+    
+    Runs in a worker process, so the console lines are returned for
+    process_svg_files() to print in order. The bool is whether the conversion
+    worked; a missing or failed citation still counts as converted.
+    """
+    console = [f"Processing {svg_path.name}..."]
+    
+    # Convert SVG to JPG
+    jpg_path = svg_path.with_suffix('.jpg')
+    if not convert_svg_to_jpg(svg_path, jpg_path):
+        console.append(f"  ✗ Conversion failed")
+        return False, console
+    
+    console.append(f"  ✓ Converted to {jpg_path.name}")
+    
+    # Add citation if metadata available
+    if metadata:
+        if add_citation_overlay(jpg_path, metadata):
+            console.append(f"  ✓ Added citation")
+        else:
+            console.append(f"  ⚠ Citation overlay failed")
+    else:
+        console.append(f"  ⚠ No metadata found, skipping citation")
+    
+    # Remove original SVG
+    svg_path.unlink()
+    return True, console
+
 def process_svg_files(image_dir: Path):
     """Convert all SVG files to JPG and add citations."""
     svg_files = list(image_dir.glob("*.svg"))
@@ -19,50 +84,28 @@ def process_svg_files(image_dir: Path):
     
     print(f"Found {len(svg_files)} SVG files to process\n")
     
+    # Wikimedia filename of every image in the download log, read once for all SVGs
+    log_filenames = read_log_filenames(image_dir / "download_log.txt")
+    
     success_count = 0
     fail_count = 0
     
-    for svg_path in svg_files:
-        print(f"Processing {svg_path.name}...")
-        
-        # Try to get metadata from log file
-        log_file = image_dir / "download_log.txt"
-        metadata = None
-        
-        if log_file.exists():
-            # Try to extract filename from log
-            with open(log_file, 'r') as f:
-                content = f.read()
-                # Look for the filename in the log
-                import re
-                pattern = rf'{svg_path.stem}.*?Downloading: (File:[^\n]+)'
-                match = re.search(pattern, content)
-                if match:
-                    wikimedia_filename = match.group(1)
-                    metadata = get_image_metadata(wikimedia_filename)
-        
-        # Convert SVG to JPG
-        jpg_path = svg_path.with_suffix('.jpg')
-        if convert_svg_to_jpg(svg_path, jpg_path):
-            print(f"  ✓ Converted to {jpg_path.name}")
-            
-            # Add citation if metadata available
-            if metadata:
-                if add_citation_overlay(jpg_path, metadata):
-                    print(f"  ✓ Added citation")
-                    success_count += 1
-                else:
-                    print(f"  ⚠ Citation overlay failed")
-                    success_count += 1  # Still count as success since conversion worked
-            else:
-                print(f"  ⚠ No metadata found, skipping citation")
+    # Metadata lookups are network-bound, so they run on threads in this process, where
+    # they share one API_RATE_LIMITER (each worker process below would get its own)
+    with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as pool:
+        metadata = list(pool.map(lookup_metadata, (log_filenames.get(svg_path.stem) for svg_path in svg_files)))
+    
+    # cairosvg parses and builds the SVG tree in pure Python, holding the GIL, so the
+    # conversions run in a CPU-sized process pool; pool.map keeps the output in file order
+    with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        results = pool.map(convert_svg, svg_files, metadata)
+        for converted, console in results:
+            for line in console:
+                print(line)
+            if converted:
                 success_count += 1
-            
-            # Remove original SVG
-            svg_path.unlink()
-        else:
-            print(f"  ✗ Conversion failed")
-            fail_count += 1
+            else:
+                fail_count += 1
     
     print(f"\n{'='*50}")
     print(f"Processing complete!")